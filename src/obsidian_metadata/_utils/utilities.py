@@ -1,5 +1,4 @@
 """Utility functions."""
-import copy
 import csv
 import re
 from os import name, system
@@ -21,8 +20,7 @@ def clean_dictionary(dictionary: dict[str, Any]) -> dict[str, Any]:
     Returns:
         dict: Cleaned dictionary
     """
-    new_dict = copy.deepcopy(dictionary)
-    new_dict = {key.strip("*[]# "): value for key, value in new_dict.items()}
+    new_dict = {key.strip("*[]# "): value for key, value in dictionary.items()}
     for key, value in new_dict.items():
         if isinstance(value, list):
             new_dict[key] = [s.strip("*[]# ") for s in value if isinstance(value, list)]
@@ -53,12 +51,17 @@ def dict_contains(
     """
     if value is None:
         if is_regex:
-            return any(re.search(key, str(_key)) for _key in dictionary)
+            key_pattern = re.compile(key)
+            return any(key_pattern.search(str(_key)) for _key in dictionary)
         return key in dictionary
 
     if is_regex:
+        key_pattern = re.compile(key)
+        value_pattern = re.compile(value)
         for _key in dictionary:
-            if re.search(key, str(_key)) and any(re.search(value, _v) for _v in dictionary[_key]):
+            if key_pattern.search(str(_key)) and any(
+                value_pattern.search(_v) for _v in dictionary[_key]
+            ):
                 return True
 
         return False
@@ -92,7 +95,8 @@ def delete_from_dict(  # noqa: C901
     Returns:
         dict: Dictionary without the key
     """
-    dictionary = copy.deepcopy(dictionary)
+    # Values are only ever replaced, never mutated, so a shallow copy is enough
+    dictionary = dict(dictionary)
 
     if value is None:
         if is_regex:
@@ -151,17 +155,17 @@ def merge_dictionaries(dict1: dict, dict2: dict) -> dict:
     Returns:
         dict: Merged dictionary.
     """
-    d1 = copy.deepcopy(dict1)
-    d2 = copy.deepcopy(dict2)
-
-    for _key in d1:
-        if not isinstance(d1[_key], list):
+    for _key in dict1:
+        if not isinstance(dict1[_key], list):
             raise TypeError(f"Key {_key} is not a list.")
-    for _key in d2:
-        if not isinstance(d2[_key], list):
+    for _key in dict2:
+        if not isinstance(dict2[_key], list):
             raise TypeError(f"Key {_key} is not a list.")
 
-    for k, v in d2.items():
+    # Copy the lists which are extended below without copying the strings within them
+    d1 = {k: list(v) for k, v in dict1.items()}
+
+    for k, v in dict2.items():
         if k in d1:
             d1[k].extend(v)
             d1[k] = sorted(set(d1[k]))
@@ -185,7 +189,7 @@ def rename_in_dict(
     Returns:
         dict: Dictionary with renamed key or value
     """
-    dictionary = copy.deepcopy(dictionary)
+    dictionary = dict(dictionary)
 
     if value_2 is None:
         if key in dictionary and value_1 not in dictionary:
@@ -1,7 +1,7 @@
 """Work with metadata items."""
 
 
-import re
+import sys
 from io import StringIO
 
 import rich.repr
@@ -9,6 +9,13 @@ from ruamel.yaml import YAML
 
 from obsidian_metadata.models.enums import MetadataType, Wrapping
 
+# A single round-trip dumper is configured once and reused for every note
+YAML_DUMPER = YAML()
+YAML_DUMPER.indent(mapping=2, sequence=4, offset=2)
+
+# Markdown characters which can surround an inline metadata key
+KEY_MARKDOWN = "*#_ `~"
+
 
 def dict_to_yaml(dictionary: dict[str, list[str]], sort_keys: bool = False) -> str:
     """Return the a dictionary of {key: [values]} as a YAML string.
@@ -28,10 +35,8 @@ def dict_to_yaml(dictionary: dict[str, list[str]], sort_keys: bool = False) -> s
         if len(value) == 1:
             dictionary[key] = value[0]  # type: ignore [assignment]
 
-    yaml = YAML()
-    yaml.indent(mapping=2, sequence=4, offset=2)
     string_stream = StringIO()
-    yaml.dump(dictionary, string_stream)
+    YAML_DUMPER.dump(dictionary, string_stream)
     yaml_value = string_stream.getvalue()
     string_stream.close()
     if yaml_value == "{}\n":
@@ -64,7 +69,8 @@ class InlineField:
         is_changed: bool = False,
     ) -> None:
         self.meta_type = meta_type
-        self.key = key
+        # Keys repeat across a vault so they are interned to share a single string object
+        self.key = sys.intern(key) if key else key
         self.value = value
         self.wrapping = wrapping
         self.is_changed = is_changed
@@ -75,7 +81,7 @@ class InlineField:
         )
 
         # Normalize value for display
-        self.normalized_value = "-" if re.match(r"^\s*$", self.value) else self.value.strip()
+        self.normalized_value = self.value.strip() or "-"
 
     def __rich_repr__(self) -> rich.repr.Result:  # pragma: no cover
         """Rich representation of the inline field."""
@@ -90,6 +96,12 @@ class InlineField:
         yield "value", self.value
         yield "wrapping", self.wrapping.value
 
+    def __copy__(self) -> "InlineField":
+        """Copy the InlineField object. All attributes are immutable so a shallow copy is complete."""
+        new = InlineField.__new__(InlineField)
+        new.__dict__.update(self.__dict__)
+        return new
+
     def __eq__(self, other: object) -> bool:
         """Compare two InlineField objects."""
         if not isinstance(other, InlineField):
@@ -120,19 +132,12 @@ class InlineField:
         Returns:
             tuple[str, str, str, str]: Cleaned key, normalized key, opening markdown, closing markdown.
         """
-        cleaned = text
-        if tmp := re.search(r"^([\*#_ `~]+)", text):
-            key_open = tmp.group(0)
-            cleaned = re.sub(rf"^{re.escape(key_open)}", "", text)
-        else:
-            key_open = ""
-
-        if tmp := re.search(r"([\*#_ `~]+)$", text):
-            key_close = tmp.group(0)
-            cleaned = re.sub(rf"{re.escape(key_close)}$", "", cleaned)
-        else:
-            key_close = ""
+        cleaned = text.lstrip(KEY_MARKDOWN)
+        key_open = text[: len(text) - len(cleaned)]
+
+        key_close = text[len(text.rstrip(KEY_MARKDOWN)) :]
+        cleaned = cleaned.removesuffix(key_close)
 
         normalized = cleaned.replace(" ", "-").lower()
 
-        return cleaned, normalized, key_open, key_close
+        return sys.intern(cleaned), sys.intern(normalized), key_open, key_close
@@ -1,14 +1,18 @@
 """Representation of a not in the vault."""
 
 
+import codecs
 import copy
 import difflib
 import re
+from collections.abc import Callable
+from functools import cached_property, lru_cache
+from itertools import islice
 from pathlib import Path
 
 import rich.repr
 import typer
-from charset_normalizer import from_path
+from charset_normalizer import from_bytes
 from rich.table import Table
 from ruamel.yaml import YAML
 
@@ -31,6 +35,70 @@ from obsidian_metadata.models.parsers import Parser
 
 P = Parser()
 
+# Lookahead for the end of a tag. Matches before any character which can not be part of a tag, or
+# at the end of the note.
+TAG_END = rf"(?![^{P.chars_not_in_tags}])"
+
+# Keys, values, and tags are escaped repeatedly during bulk operations across a vault
+escape_cached = lru_cache(maxsize=16384)(re.escape)
+
+# Characters with a special meaning in regular expressions
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+@lru_cache(maxsize=4096)
+def compile_cached(pattern: str) -> re.Pattern:
+    """Compile a pattern used to edit note content. Compiled patterns are reused across notes.
+
+    Args:
+        pattern (str): The regular expression to compile.
+
+    Returns:
+        re.Pattern: The compiled pattern with re.MULTILINE set.
+    """
+    return re.compile(pattern, flags=re.MULTILINE)
+
+
+def search_function(pattern: str, is_regex: bool) -> Callable[[str], object]:
+    """Return a function which checks whether a string contains a pattern.
+
+    Plain text, and regular expressions without metacharacters, are checked with a substring test which matches the same strings without running the regex engine.
+
+    Args:
+        pattern (str): The pattern to search for (plain text or regular expression).
+        is_regex (bool): Whether the pattern is a regex pattern or plain text.
+
+    Returns:
+        Callable[[str], object]: Function returning a truthy value when the string contains the pattern.
+    """
+    if is_regex and not REGEX_METACHARACTERS.isdisjoint(pattern):
+        return re.compile(pattern).search
+
+    return lambda text: pattern in text
+
+
+def match_function(pattern: str, is_regex: bool) -> Callable[[str], object]:
+    """Return a function which checks whether a string matches a pattern.
+
+    Plain text must equal the entire string. Regular expressions are searched for anywhere in the string.
+
+    Args:
+        pattern (str): The pattern to match (plain text or regular expression).
+        is_regex (bool): Whether the pattern is a regex pattern or plain text.
+
+    Returns:
+        Callable[[str], object]: Function returning a truthy value when the string matches the pattern.
+    """
+    if is_regex:
+        return search_function(pattern, is_regex)
+
+    return lambda text: text == pattern
+
+
+# A single safe loader is reused for every note. ruamel uses the libyaml C parser when available.
+YAML_SAFE = YAML(typ="safe")
+YAML_SAFE.allow_unicode = False
+
 
 @rich.repr.auto
 class Note:
@@ -55,22 +123,61 @@ class Note:
         self.dry_run: bool = dry_run
 
         try:
-            result = from_path(self.note_path).best()
-            self.encoding: str = result.encoding
-            self.file_content: str = str(result)
-            self.original_file_content: str = str(result)
+            self.encoding: str
+            self.file_content: str
+            self.encoding, self.file_content = self._decode(self.note_path.read_bytes())
+            self.original_file_content: str = self.file_content
+            self._original_hash: int = hash(self.original_file_content)
+            self._diff_cache: tuple[str, list[str]] | None = None
         except FileNotFoundError as e:
             alerts.error(f"Note {self.note_path} not found. Exiting")
             raise typer.Exit(code=1) from e
         except UnicodeDecodeError as e:
             alerts.error(
-                f"Error decoding note {self.note_path}.\nDetected encoding: {self.encoding}\nExiting"
+                f"Error decoding note {self.note_path}.\nDetected encoding: {e.encoding}\nExiting"
             )
             raise typer.Exit(code=1) from e
 
+    def __rich_repr__(self) -> rich.repr.Result:  # pragma: no cover
+        """Define rich representation of Vault."""
+        yield "dry_run", self.dry_run
+        yield "encoding", self.encoding
+        yield "note_path", self.note_path
+
+    @staticmethod
+    def _decode(raw: bytes) -> tuple[str, str]:
+        """Decode the raw bytes of a note file.
+
+        Most notes are UTF-8, so charset detection only runs when strict UTF-8 decoding fails or
+        the file starts with a byte order mark.
+
+        Args:
+            raw (bytes): Contents of the note file.
+
+        Returns:
+            tuple[str, str]: Encoding of the file and its decoded contents.
+        """
+        if not raw.startswith(codecs.BOM_UTF8):
+            try:
+                return "utf_8", raw.decode("utf_8")
+            except UnicodeDecodeError:
+                pass
+
+        result = from_bytes(raw).best()
+        return result.encoding, str(result)
+
+    @cached_property
+    def metadata(self) -> list[InlineField]:
+        """Metadata in the note, parsed from the file content on first access.
+
+        Notes outside the vault's filters are never parsed. The parsed metadata is also
+        snapshotted into `original_metadata` for change detection.
+
+        Raises:
+            typer.Exit: If the frontmatter, inline metadata, or inline tags can not be parsed.
+        """
         try:
-            self.metadata = self._grab_all_metadata(self.file_content)
-            self.original_metadata = copy.deepcopy(self.metadata)
+            metadata = self._grab_all_metadata(self.file_content)
         except FrontmatterError as e:
             alerts.error(f"Invalid frontmatter: {self.note_path}\n{e}")
             raise typer.Exit(code=1) from e
@@ -81,23 +188,18 @@ class Note:
             alerts.error(f"Error parsing inline tags: {self.note_path}\n{e}")
             raise typer.Exit(code=1) from e
 
-    def __rich_repr__(self) -> rich.repr.Result:  # pragma: no cover
-        """Define rich representation of Vault."""
-        yield "dry_run", self.dry_run
-        yield "encoding", self.encoding
-        yield "note_path", self.note_path
+        self.original_metadata: list[InlineField] = [copy.copy(x) for x in metadata]
+        return metadata
 
-    def _grab_all_metadata(self, text: str) -> list[InlineField]:  # noqa: C901
+    def _grab_all_metadata(self, text: str) -> list[InlineField]:
         """Grab all metadata from the note and create list of InlineField objects."""
         all_metadata = []  # List of all metadata to be returned
 
         # First parse the frontmatter
         frontmatter_block = P.return_frontmatter(text, data_only=True)
         if frontmatter_block:
-            yaml = YAML(typ="safe")
-            yaml.allow_unicode = False
             try:
-                frontmatter: dict = yaml.load(frontmatter_block)
+                frontmatter: dict = YAML_SAFE.load(frontmatter_block)
             except Exception as e:  # noqa: BLE001
                 raise FrontmatterError(e) from e
 
@@ -124,32 +226,75 @@ class Note:
                         )
                     )
 
-        # strip frontmatter and code blocks from the text and parse inline metadata
+        # strip frontmatter and code blocks from the text and parse inline metadata in a single pass
         text = P.strip_frontmatter(P.strip_code_blocks(text))
-        for _line in text.splitlines():
-            inline_metadata = P.return_inline_metadata(_line)
-            if inline_metadata:
-                # for item in inline_metadata:
-                for key, value, wrapper in inline_metadata:
-                    all_metadata.append(
-                        InlineField(
-                            meta_type=MetadataType.INLINE,
-                            key=key,
-                            value=value,
-                            wrapping=wrapper,
-                        )
-                    )
+        for key, value, wrapper in P.return_inline_metadata(text) or []:
+            all_metadata.append(
+                InlineField(
+                    meta_type=MetadataType.INLINE,
+                    key=key,
+                    value=value,
+                    wrapping=wrapper,
+                )
+            )
 
         # Then strip all inline code and parse tags
         text = P.strip_inline_code(text)
-        for _line in text.splitlines():
-            tags = [
-                InlineField(meta_type=MetadataType.TAGS, key=None, value=tag.lstrip("#"))
-                for tag in P.return_tags(_line)
-            ]
-            all_metadata.extend(tags)
+        all_metadata.extend(
+            InlineField(meta_type=MetadataType.TAGS, key=None, value=tag.lstrip("#"))
+            for tag in P.return_tags(text)
+        )
+
+        return list(dict.fromkeys(all_metadata))
+
+    def _delete_fields(self, meta_to_delete: list[InlineField]) -> bool:
+        """Delete InlineField objects from the note's metadata and content. Inline metadata and tags are removed from the content in a single pass each and frontmatter is rewritten once.
 
-        return list(set(all_metadata))
+        Args:
+            meta_to_delete (list[InlineField]): InlineField objects to delete.
+
+        Returns:
+            bool: Whether metadata was deleted.
+        """
+        removed_frontmatter = False
+        failed_inline = set(
+            self._delete_inline_metadata_batch(
+                [x for x in meta_to_delete if x.meta_type == MetadataType.INLINE]
+            )
+        )
+        failed_tags = set(
+            self._delete_tags_batch([x for x in meta_to_delete if x.meta_type == MetadataType.TAGS])
+        )
+        removed: set[InlineField] = set()
+
+        for field in meta_to_delete:
+            match field.meta_type:
+                case MetadataType.FRONTMATTER:
+                    removed_frontmatter = True
+                    removed.add(field)
+
+                case MetadataType.INLINE:
+                    if field not in failed_inline:
+                        removed.add(field)
+                    else:
+                        log.warning(
+                            f"Failed to delete {field.clean_key} from {self.note_path.name}"
+                        )
+
+                case MetadataType.TAGS:
+                    if field not in failed_tags:
+                        removed.add(field)
+                    else:
+                        log.warning(f"Failed to delete #{field.value} from {self.note_path.name}")
+                        self._remove_fields(removed)
+                        return False
+
+        self._remove_fields(removed)
+
+        if removed_frontmatter:
+            self.write_frontmatter()
+
+        return True
 
     def _delete_inline_metadata(self, source: InlineField) -> bool:
         """Delete a specified inline metadata field from the note.
@@ -160,33 +305,90 @@ class Note:
         Returns:
             bool: True if successful, False if not.
         """
+        return self.sub(self._delete_inline_metadata_pattern(source), "", is_regex=True)
+
+    def _delete_inline_metadata_batch(self, sources: list[InlineField]) -> list[InlineField]:
+        """Delete multiple inline metadata fields from the note in a single pass over the content.
+
+        Fields which are not found in the combined pass are retried individually.
+
+        Args:
+            sources (list[InlineField]): InlineField objects to delete.
+
+        Returns:
+            list[InlineField]: Fields which could not be deleted from the note.
+        """
+        if not sources:
+            return []
+
+        # Wrap each field's pattern in a capture group to identify which field matched
+        combined = compile_cached(
+            "|".join(f"({self._delete_inline_metadata_pattern(x)})" for x in sources)
+        )
+        found_indexes: set[int] = set()
+
+        def _remove(match: re.Match) -> str:
+            found_indexes.add(match.lastindex - 1)
+            return ""
+
+        self.file_content = combined.sub(_remove, self.file_content)
+
+        return [
+            field
+            for index, field in enumerate(sources)
+            if index not in found_indexes and not self._delete_inline_metadata(field)
+        ]
+
+    def _delete_inline_metadata_pattern(self, source: InlineField) -> str:
+        """Build the regex pattern which removes an inline metadata field from the note.
+
+        Args:
+            source (InlineField): InlineField object to delete.
+
+        Returns:
+            str: Regex pattern matching the field and its surrounding whitespace.
+        """
         if source.meta_type != MetadataType.INLINE:
             log.error("Must provide inline metadata to _sub_inline_metadata")
             raise typer.Exit(code=1)
 
-        remove_string = f"{re.escape(source.key)}::{re.escape(source.value)}"
-        if source.wrapping == Wrapping.NONE:
-            return self.sub(
-                rf"( *> *){remove_string}\s+|{remove_string}(\s+|$)",
-                "",
-                is_regex=True,
-            )
+        remove_string = f"{escape_cached(source.key)}::{escape_cached(source.value)}"
 
-        if source.wrapping == Wrapping.PARENS:
-            return self.sub(
-                rf" ?\({remove_string}\)",
-                "",
-                is_regex=True,
-            )
+        match source.wrapping:
+            case Wrapping.PARENS:
+                return rf" ?\({remove_string}\)"
+            case Wrapping.BRACKETS:
+                return rf" ?\[{remove_string}\]"
+            case _:
+                # A single branch with an optional blockquote prefix avoids matching the key/value twice
+                return rf"(?: *> *)?{remove_string}(?:\s+|$)"
 
-        if source.wrapping == Wrapping.BRACKETS:
-            return self.sub(
-                rf" ?\[{remove_string}\]",
-                "",
-                is_regex=True,
-            )
+    def _delete_tags_batch(self, sources: list[InlineField]) -> list[InlineField]:
+        """Delete multiple tags from the note in a single pass over the content.
+
+        Args:
+            sources (list[InlineField]): InlineField objects of the tags to delete.
+
+        Returns:
+            list[InlineField]: Tags which could not be found in the note.
+        """
+        if not sources:
+            return []
+
+        # Wrap each tag in a capture group to identify which tag matched. The character which ends
+        # the tag is matched with a lookahead so that it stays in the note.
+        combined = compile_cached(
+            "#(?:" + "|".join(f"({escape_cached(x.value)})" for x in sources) + f"){TAG_END}"
+        )
+        found_indexes: set[int] = set()
 
-        return False  # type: ignore [unreachable]
+        def _remove(match: re.Match) -> str:
+            found_indexes.add(match.lastindex - 1)
+            return ""
+
+        self.file_content = combined.sub(_remove, self.file_content)
+
+        return [field for index, field in enumerate(sources) if index not in found_indexes]
 
     def _edit_inline_metadata(
         self, source: InlineField, new_key: str, new_value: str | None = None
@@ -263,26 +465,26 @@ class Note:
             value = value.lstrip("#")
 
         if not is_regex:
-            key = f"^{re.escape(key)}$" if key else None
-            value = f"^{re.escape(value)}$" if value else None
+            key = key or None
+            value = value or None
+
+        # Build the matchers once per call rather than for every field
+        key_match = match_function(key, is_regex) if key is not None else None
+        value_match = match_function(value, is_regex) if value is not None else None
 
         matching_inline_fields = []
-        if key is None and value is None:
+        if key_match is None and value_match is None:
             matching_inline_fields.extend([x for x in self.metadata if x.meta_type == meta_type])
-        elif value is None:
+        elif value_match is None:
             matching_inline_fields.extend(
-                [
-                    x
-                    for x in self.metadata
-                    if x.meta_type == meta_type and re.search(key, x.clean_key)
-                ]
+                [x for x in self.metadata if x.meta_type == meta_type and key_match(x.clean_key)]
             )
-        elif key is None:
+        elif key_match is None:
             matching_inline_fields.extend(
                 [
                     x
                     for x in self.metadata
-                    if x.meta_type == meta_type and re.search(value, x.normalized_value)
+                    if x.meta_type == meta_type and value_match(x.normalized_value)
                 ]
             )
         else:
@@ -291,13 +493,22 @@ class Note:
                     x
                     for x in self.metadata
                     if x.meta_type == meta_type
-                    and re.search(key, x.clean_key)
-                    and re.search(value, x.normalized_value)
+                    and key_match(x.clean_key)
+                    and value_match(x.normalized_value)
                 ]
             )
 
         return matching_inline_fields
 
+    def _remove_fields(self, fields: set[InlineField]) -> None:
+        """Remove multiple InlineField objects from the note's metadata in a single pass.
+
+        Args:
+            fields (set[InlineField]): InlineField objects to remove.
+        """
+        if fields:
+            self.metadata[:] = [x for x in self.metadata if x not in fields]
+
     def _update_inline_metadata(
         self, source: InlineField, new_key: str | None = None, new_value: str | None = None
     ) -> bool:
@@ -313,7 +524,22 @@ class Note:
 
         # TODO: Add support for fields where value is a [[link]]
         """
-        if source.meta_type != MetadataType.INLINE:
+        return not self._update_inline_metadata_batch([source], new_key, new_value)
+
+    def _update_inline_metadata_batch(
+        self, sources: list[InlineField], new_key: str | None = None, new_value: str | None = None
+    ) -> list[InlineField]:
+        """Update multiple inline metadata fields with the same new key and/or value in a single pass over the content.
+
+        Args:
+            sources (list[InlineField]): InlineField objects to update.
+            new_key (str, optional): New key to use.
+            new_value (str, optional): New value to use.
+
+        Returns:
+            list[InlineField]: Fields which could not be found in the note.
+        """
+        if any(x.meta_type != MetadataType.INLINE for x in sources):
             log.error("Must provide inline metadata to _sub_inline_metadata")
             raise typer.Exit(code=1)
 
@@ -321,39 +547,49 @@ class Note:
             log.error("Must provide new key or value to _sub_inline_metadata")
             raise typer.Exit(code=1)
 
-        original_key = re.escape(source.key)
-        original_value = re.escape(source.value)
+        patterns: list[str] = []
+        replacements: list[str] = []
+        for source in sources:
+            original_key = escape_cached(source.key)
+            original_value = escape_cached(source.value)
 
-        source.key = f"{source.key_open}{new_key}{source.key_close}" if new_key else source.key
-        source.clean_key = (
-            f"{source.key_open}{new_key}{source.key_close}" if new_key else source.clean_key
-        )
-        source.normalized_key = (
-            new_key.replace(" ", "-").lower() if new_key else source.normalized_key
-        )
-        source.value = f" {new_value.lstrip()}" if new_value else source.value
-        source.normalized_value = new_value if new_value else source.normalized_value
-        source.is_changed = True
+            source.key = f"{source.key_open}{new_key}{source.key_close}" if new_key else source.key
+            source.clean_key = (
+                f"{source.key_open}{new_key}{source.key_close}" if new_key else source.clean_key
+            )
+            source.normalized_key = (
+                new_key.replace(" ", "-").lower() if new_key else source.normalized_key
+            )
+            source.value = f" {new_value.lstrip()}" if new_value else source.value
+            source.normalized_value = new_value if new_value else source.normalized_value
+            source.is_changed = True
 
-        match source.wrapping:
-            case Wrapping.NONE:
-                return self.sub(
-                    f"{original_key}:: ?{original_value}",
-                    f"{source.key}::{source.value}",
-                    is_regex=True,
-                )
-            case Wrapping.PARENS:
-                return self.sub(
-                    rf"\({original_key}:: ?{original_value}\)",
-                    f"({source.key}::{source.value})",
-                    is_regex=True,
-                )
-            case Wrapping.BRACKETS:
-                return self.sub(
-                    rf"\[{original_key}::{original_value}\]",
-                    f"[{source.key}::{source.value}]",
-                    is_regex=True,
-                )
+            match source.wrapping:
+                case Wrapping.NONE:
+                    patterns.append(f"{original_key}:: ?{original_value}")
+                    replacements.append(f"{source.key}::{source.value}")
+                case Wrapping.PARENS:
+                    patterns.append(rf"\({original_key}:: ?{original_value}\)")
+                    replacements.append(f"({source.key}::{source.value})")
+                case Wrapping.BRACKETS:
+                    patterns.append(rf"\[{original_key}::{original_value}\]")
+                    replacements.append(f"[{source.key}::{source.value}]")
+
+        if not patterns:
+            return []
+
+        # Wrap each field's pattern in a capture group to identify which field matched
+        combined = compile_cached("|".join(f"({pattern})" for pattern in patterns))
+        found_indexes: set[int] = set()
+
+        def _replace(match: re.Match) -> str:
+            index = match.lastindex - 1
+            found_indexes.add(index)
+            return replacements[index]
+
+        self.file_content = combined.sub(_replace, self.file_content)
+
+        return [field for index, field in enumerate(sources) if index not in found_indexes]
 
     def add_metadata(
         self,
@@ -375,7 +611,7 @@ class Note:
         """
         match meta_type:
             case MetadataType.FRONTMATTER | MetadataType.INLINE:
-                if added_key is None or re.match(r"^\s*$", added_key):
+                if added_key is None or not added_key.strip():
                     log.error("A valid key must be specified.")
                     raise typer.Exit(code=1)
                 if self.contains_metadata(meta_type, added_key, added_value):
@@ -398,7 +634,7 @@ class Note:
                         return True
 
             case MetadataType.TAGS:
-                if added_value is None or re.match(r"^\s*$", added_value):
+                if added_value is None or not added_value.strip():
                     log.error("A tag must be specified to add.")
                     raise typer.Exit(code=1)
 
@@ -435,6 +671,8 @@ class Note:
     def commit(self, path: Path | None = None) -> None:
         """Write the note's new content to disk. This is a destructive action.
 
+        Notes without changes are not rewritten to their own path.
+
         Args:
             path (Path): Path to write the note to. Defaults to the note's path.
 
@@ -446,10 +684,13 @@ class Note:
             log.trace(f"DRY RUN: Writing note {p} to disk")
             return
 
+        if path is None and not self.has_changes():
+            log.trace(f"No changes to {p}, skipping write")
+            return
+
         try:
             log.trace(f"Writing note {p} to disk")
-            content_bytes = bytes(self.file_content, self.encoding)
-            p.write_bytes(content_bytes)
+            p.write_bytes(self.file_content.encode(self.encoding))
         except FileNotFoundError as e:
             alerts.error(f"Note {p} not found. Exiting")
             raise typer.Exit(code=1) from e
@@ -483,42 +724,41 @@ class Note:
             ) or self.contains_metadata(MetadataType.INLINE, search_key, search_value, is_regex)
 
         if meta_type in [MetadataType.FRONTMATTER, MetadataType.INLINE]:
-            if search_key is None or re.match(r"^\s*$", search_key):
+            if search_key is None or not search_key.strip():
                 return False
 
-            search_key = re.escape(search_key) if not is_regex else search_key
+            key_search = search_function(search_key, is_regex)
 
             if search_value is None:
                 return any(
-                    re.search(search_key, item.clean_key)
+                    key_search(item.clean_key)
                     for item in self.metadata
                     if item.meta_type == meta_type
                 )
 
-            search_value = re.escape(search_value) if not is_regex else search_value
+            value_search = search_function(search_value, is_regex)
 
             return any(
-                re.search(search_value, str(item.normalized_value))
+                value_search(str(item.normalized_value))
                 for item in self.metadata
-                if item.meta_type == meta_type and re.search(search_key, str(item.clean_key))
+                if item.meta_type == meta_type and key_search(str(item.clean_key))
             )
 
         if meta_type == MetadataType.TAGS:
-            if search_key is not None or search_value is None or re.match(r"^\s*$", search_value):
+            if search_key is not None or search_value is None or not search_value.strip():
                 return False
 
-            search_value = search_value.lstrip("#")
-            search_value = re.escape(search_value) if not is_regex else search_value
+            value_search = search_function(search_value.lstrip("#"), is_regex)
 
             return any(
-                re.search(search_value, str(item.normalized_value))
+                value_search(str(item.normalized_value))
                 for item in self.metadata
                 if item.meta_type == meta_type
             )
 
         return False
 
-    def delete_metadata(  # noqa: PLR0912, C901
+    def delete_metadata(  # noqa: C901
         self,
         meta_type: MetadataType,
         key: str | None = None,
@@ -536,10 +776,9 @@ class Note:
         Returns:
             bool: Whether metadata was deleted.
         """
-        removed_frontmatter = False
         meta_to_delete = []
         if meta_type == MetadataType.META:
-            if key is None or re.match(r"^\s*$", key):
+            if key is None or not key.strip():
                 log.error("A valid key must be specified.")
                 raise typer.Exit(code=1)
 
@@ -551,7 +790,7 @@ class Note:
             )
 
         elif meta_type == MetadataType.ALL:
-            if key is not None and not re.match(r"^\s*$", key):
+            if key is not None and key.strip():
                 meta_to_delete.extend(
                     self._find_matching_fields(MetadataType.FRONTMATTER, key, value, is_regex)
                 )
@@ -559,19 +798,19 @@ class Note:
                     self._find_matching_fields(MetadataType.INLINE, key, value, is_regex)
                 )
 
-            if key is None and value is not None and not re.match(r"^\s*$", value):
+            if key is None and value is not None and value.strip():
                 meta_to_delete.extend(
                     self._find_matching_fields(MetadataType.TAGS, key, value, is_regex)
                 )
         elif meta_type in {MetadataType.FRONTMATTER, MetadataType.INLINE}:
-            if key is None or re.match(r"^\s*$", key):
+            if key is None or not key.strip():
                 log.error("A valid key must be specified.")
                 raise typer.Exit(code=1)
 
             meta_to_delete.extend(self._find_matching_fields(meta_type, key, value, is_regex))
 
         elif meta_type == MetadataType.TAGS:
-            if key is not None or (value is None or re.match(r"^\s*$", value)):
+            if key is not None or (value is None or not value.strip()):
                 log.error("A valid tag must be specified.")
                 raise typer.Exit(code=1)
 
@@ -580,51 +819,46 @@ class Note:
         if len(meta_to_delete) == 0:
             return False
 
-        for field in meta_to_delete:
+        return self._delete_fields(meta_to_delete)
+
+    def delete_all_metadata(self) -> bool:
+        """Delete all metadata from the note. Removes all frontmatter and inline metadata and tags from the body of the note and from the associated InlineField objects.
+
+        Returns:
+            bool: Whether metadata was deleted.
+        """
+        deleted_frontmatter = False
+        failed_inline = set(
+            self._delete_inline_metadata_batch(
+                [x for x in self.metadata if x.meta_type == MetadataType.INLINE]
+            )
+        )
+        failed_tags = set(
+            self._delete_tags_batch([x for x in self.metadata if x.meta_type == MetadataType.TAGS])
+        )
+        removed: set[InlineField] = set()
+
+        for field in self.metadata:
             match field.meta_type:
                 case MetadataType.FRONTMATTER:
-                    removed_frontmatter = True
-                    self.metadata.remove(field)
+                    deleted_frontmatter = True
+                    removed.add(field)
 
                 case MetadataType.INLINE:
-                    if self._delete_inline_metadata(field):
-                        self.metadata.remove(field)
+                    if field not in failed_inline:
+                        removed.add(field)
                     else:
                         log.warning(
                             f"Failed to delete {field.clean_key} from {self.note_path.name}"
                         )
 
                 case MetadataType.TAGS:
-                    if self.sub(
-                        f"#{re.escape(field.value)}([{P.chars_not_in_tags}])", "\1", is_regex=True
-                    ):
-                        self.metadata.remove(field)
+                    if field not in failed_tags:
+                        removed.add(field)
                     else:
                         log.warning(f"Failed to delete #{field.value} from {self.note_path.name}")
-                        return False
 
-        if removed_frontmatter:
-            self.write_frontmatter()
-
-        return True
-
-    def delete_all_metadata(self) -> bool:
-        """Delete all metadata from the note. Removes all frontmatter and inline metadata and tags from the body of the note and from the associated InlineField objects.
-
-        Returns:
-            bool: Whether metadata was deleted.
-        """
-        deleted_frontmatter = False
-        meta_to_delete = copy.deepcopy(self.metadata)
-
-        for field in meta_to_delete:
-            if field.meta_type == MetadataType.FRONTMATTER:
-                deleted_frontmatter = True
-                self.metadata.remove(field)
-            else:
-                self.delete_metadata(
-                    field.meta_type, field.clean_key, field.normalized_value, is_regex=False
-                )
+        self._remove_fields(removed)
 
         if deleted_frontmatter:
             self.write_frontmatter()
@@ -640,24 +874,41 @@ class Note:
         Returns:
             bool: Whether the note has been updated.
         """
-        if (
-            self.original_metadata != self.metadata
-            or self.original_file_content != self.file_content
+        # Unchanged content is the original string object. String hashes are cached on the object
+        # so repeated calls on changed content avoid a full string comparison.
+        if self.file_content is not self.original_file_content and (
+            hash(self.file_content) != self._original_hash
+            or self.file_content != self.original_file_content
         ):
             return True
 
-        return False
+        # Metadata that was never parsed can not have been changed
+        if "metadata" not in self.__dict__:
+            return False
+
+        return len(self.metadata) != len(self.original_metadata) or (
+            self.metadata != self.original_metadata
+        )
 
     def print_diff(self) -> None:
         """Print a diff of the note's content. Compares original state to it's new state."""
-        a = self.original_file_content.splitlines()
-        b = self.file_content.splitlines()
+        # The diff is cached against the current content so that reviewing the same note
+        # repeatedly does not split and compare both versions again
+        if self._diff_cache is None or self._diff_cache[0] is not self.file_content:
+            a = self.original_file_content.splitlines()
+            b = self.file_content.splitlines()
+            # Only changed lines are shown so no context is requested. The two file header lines
+            # and the hunk markers are skipped and lines are prefixed like difflib.Differ output.
+            changed_lines = [
+                f"{line[0]} {line[1:]}"
+                for line in islice(difflib.unified_diff(a, b, n=0, lineterm=""), 2, None)
+                if line.startswith(("+", "-"))
+            ]
+            self._diff_cache = (self.file_content, changed_lines)
 
-        diff = difflib.Differ()
-        result = list(diff.compare(a, b))
         table = Table(title=f"\nDiff of {self.note_path.name}", show_header=False, min_width=50)
 
-        for line in result:
+        for line in self._diff_cache[1]:
             if line.startswith("+"):
                 table.add_row(line, style="green")
             elif line.startswith("-"):
@@ -717,12 +968,11 @@ class Note:
                     field.value = value_2
                     field.normalized_value = value_2.strip()
 
-            if field.meta_type == MetadataType.INLINE:
-                field.is_changed = True
-                if value_2 is None:
-                    self._update_inline_metadata(field, new_key=value_1)
-                else:
-                    self._update_inline_metadata(field, new_value=value_2)
+        inline_fields = [x for x in fields_to_rename if x.meta_type == MetadataType.INLINE]
+        if value_2 is None:
+            self._update_inline_metadata_batch(inline_fields, new_key=value_1)
+        else:
+            self._update_inline_metadata_batch(inline_fields, new_value=value_2)
 
         if frontmatter_is_changed:
             self.write_frontmatter()
@@ -748,9 +998,9 @@ class Note:
         if len(fields_to_rename) == 0:
             return False
 
+        self.sub(rf"#{escape_cached(old_tag)}{TAG_END}", f"#{new_tag}", is_regex=True)
         for field in fields_to_rename:
             field.is_changed = True
-            self.sub(rf"#{re.escape(field.value)}", f"#{new_tag}", is_regex=True)
             field.value = new_tag
             field.normalized_value = new_tag
 
@@ -767,16 +1017,18 @@ class Note:
         Returns:
             bool: Whether text was substituted.
         """
+        # Plain text is replaced literally without going through the regex engine
         if not is_regex:
-            pattern = re.escape(pattern)
+            if pattern not in self.file_content:
+                return False
+            self.file_content = self.file_content.replace(pattern, replacement)
+            return True
 
-        self.file_content, num_subs = re.subn(
-            pattern, replacement, self.file_content, flags=re.MULTILINE
-        )
+        self.file_content, num_subs = compile_cached(pattern).subn(replacement, self.file_content)
 
         return num_subs > 0
 
-    def transpose_metadata(
+    def transpose_metadata(  # noqa: C901
         self,
         begin: MetadataType,
         end: MetadataType,
@@ -815,19 +1067,41 @@ class Note:
         if len(meta_to_transpose) == 0:
             return False
 
-        for field in sorted(
+        meta_to_transpose = sorted(
             meta_to_transpose,
             reverse=location != InsertLocation.BOTTOM,
             key=lambda x: (x.clean_key, x.normalized_value),
-        ):
-            self.delete_metadata(begin, field.clean_key, field.normalized_value)
-            self.add_metadata(
-                end,
-                field.clean_key,
-                field.normalized_value if field.normalized_value != "-" else "",
-                location,
+        )
+        self._delete_fields(meta_to_transpose)
+
+        # Add the new metadata objects first and write them to the note content once
+        new_strings = []
+        for field in meta_to_transpose:
+            new_value = field.normalized_value if field.normalized_value != "-" else ""
+            if self.contains_metadata(end, field.clean_key, new_value):
+                continue
+
+            self.metadata.append(
+                InlineField(meta_type=end, key=field.clean_key, value=new_value, is_changed=True)
+            )
+            new_strings.append(
+                f"{field.clean_key}:: {new_value}" if new_value else f"{field.clean_key}::"
             )
 
+        if not new_strings:
+            return True
+
+        match end:
+            case MetadataType.FRONTMATTER:
+                self.write_frontmatter()
+            case MetadataType.INLINE:
+                # Fields were sorted in reverse to be inserted one at a time at the top
+                if location != InsertLocation.BOTTOM:
+                    new_strings.reverse()
+                new_strings = [x for x in new_strings if x not in self.file_content]
+                if new_strings:
+                    self.write_string("\n".join(new_strings), location, allow_multiple=True)
+
         return True
 
     def write_frontmatter(self, sort_keys: bool = False) -> bool:
@@ -840,10 +1114,7 @@ class Note:
             bool: Whether frontmatter was written to the note.
         """
         # First we find the current frontmatter block in the note.
-        try:
-            current_frontmatter = P.return_frontmatter(self.file_content, data_only=False)
-        except AttributeError:
-            current_frontmatter = None
+        current_frontmatter = P.return_frontmatter(self.file_content, data_only=False)
 
         frontmatter_objects_as_dict: dict[str, list[str]] = {}
         for k, v in [
@@ -855,8 +1126,6 @@ class Note:
         if current_frontmatter is None and len(frontmatter_objects_as_dict) == 0:
             return False
 
-        # TODO: Make no changes if frontmatter in content is the same as all frontmatter metadata objects
-
         # Update frontmatter in the note
         new_frontmatter = dict_to_yaml(frontmatter_objects_as_dict, sort_keys=sort_keys)
 
@@ -866,8 +1135,17 @@ class Note:
             self.file_content = new_frontmatter + self.file_content
             return True
 
-        current_frontmatter = f"{re.escape(current_frontmatter)}\n?"
-        self.sub(current_frontmatter, new_frontmatter, is_regex=True)
+        # Replace the block and a single trailing newline without running it through a regex
+        start = self.file_content.find(current_frontmatter)
+        end = start + len(current_frontmatter)
+        if self.file_content.startswith("\n", end):
+            end += 1
+
+        # Make no changes if the frontmatter in the content already matches the metadata
+        if self.file_content[start:end] == new_frontmatter:
+            return False
+
+        self.file_content = self.file_content[:start] + new_frontmatter + self.file_content[end:]
         return True
 
     def write_string(
@@ -886,7 +1164,7 @@ class Note:
         Returns:
             bool: Whether the note was updated.
         """
-        if not allow_multiple and len(re.findall(re.escape(new_string), self.file_content)) > 0:
+        if not allow_multiple and new_string in self.file_content:
             return False
 
         match location:
@@ -901,9 +1179,9 @@ class Note:
                     self.file_content = f"{new_string}\n{self.file_content}"
                     return True
 
-                new_string = f"{frontmatter}\n{new_string}"
-                ecaped_frontmatter = re.escape(frontmatter)
-                self.sub(ecaped_frontmatter, new_string, is_regex=True)
+                self.file_content = self.file_content.replace(
+                    frontmatter, f"{frontmatter}\n{new_string}", 1
+                )
                 return True
 
             case InsertLocation.AFTER_TITLE:
@@ -913,9 +1191,9 @@ class Note:
                     self.file_content = f"{new_string}\n{self.file_content}"
                     return True
 
-                new_string = f"{top.strip()}\n{new_string}\n"
-                top = re.escape(top)
-                self.sub(top, new_string, is_regex=True)
+                self.file_content = self.file_content.replace(
+                    top, f"{top.strip()}\n{new_string}\n", 1
+                )
                 return True
             case _:  # pragma: no cover
                 raise ValueError(f"Invalid location: {location}")
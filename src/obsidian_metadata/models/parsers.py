@@ -1,6 +1,7 @@
 """Parsers for Obsidian metadata files."""
 
 from dataclasses import dataclass
+from functools import cached_property
 
 import emoji
 import regex as re
@@ -19,78 +20,110 @@ class Parser:
     internal_link = r"\[\[[^\[\]]*?\]\]"  # An Obsidian link of the form [[<link>]]
     chars_not_in_tags = r"\u2000-\u206F\u2E00-\u2E7F'!\"#\$%&\(\)\*+,\.:;<=>?@\^`\{\|\}~\[\]\\\s"
 
-    # Compiled regex patterns
-    tag = re.compile(
-        r"""
-        (?:
-            (?:^|\s|\\{2}) # If tarts with newline, space, or "\\""
-                (?P<tag>\#[^\u2000-\u206F\u2E00-\u2E7F'!\"\#\$%&\(\)\*+,\.:;<=>?@\^`\{\|\}~\[\]\\\s]+) # capture tag
-                | # Else
-                (?:(?<=
-                    \#[^\u2000-\u206F\u2E00-\u2E7F'!\"\#\$%&\(\)\*+,\.:;<=>?@\^`\{\|\}~\[\]\\\s]+
-                )) # if lookbehind is a tag
-                    (?P<tag>\#[^\u2000-\u206F\u2E00-\u2E7F'!\"\#\$%&\(\)\*+,\.:;<=>?@\^`\{\|\}~\[\]\\\s]+) # capture tag
-                    | # Else
-                    (*FAIL)
-        )
-        """,
-        re.X,
+    # Characters which can not be part of a tag. Mirrors `chars_not_in_tags` for scanning without regex
+    whitespace = frozenset(
+        "\t\n\v\f\r \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+        "\u2028\u2029\u202f\u205f\u3000"
     )
-    frontmatter_complete = re.compile(r"^\s*(?P<frontmatter>---.*?---)", flags=re.DOTALL)
-    frontmatter_data = re.compile(
-        r"(?P<open>^\s*---)(?P<frontmatter>.*?)(?P<close>---)", flags=re.DOTALL
+    not_in_tags = (
+        whitespace
+        | frozenset("'!\"#$%&()*+,.:;<=>?@^`{|}~[]\\")
+        | frozenset(map(chr, range(0x2000, 0x2070)))
+        | frozenset(map(chr, range(0x2E00, 0x2E80)))
     )
-    code_block = re.compile(r"```.*?```", flags=re.DOTALL)
-    inline_code = re.compile(r"(?<!`{2})`[^`]+?` ?")
-    inline_metadata = re.compile(
-        r"""
-        (?: # Conditional
-            (?= # If opening wrapper is a bracket or parenthesis
-                (
-                    (?<!\[)\[(?!\[) # Single bracket
-                    |               # Or
-                    (?<!\()\((?!\() # Single parenthesis
-                    )
-                )
-                (?: # Conditional
-                    (?= # If opening wrapper is a bracket
+
+    # Compiled regex patterns. Compiled on first use to keep imports fast
+    @cached_property
+    def frontmatter_complete(self) -> re.Pattern:
+        """Frontmatter block including the opening and closing `---` lines."""
+        return re.compile(r"^\s*(?P<frontmatter>---.*?---)", flags=re.DOTALL)
+
+    @cached_property
+    def frontmatter_data(self) -> re.Pattern:
+        """Frontmatter data with the opening and closing `---` lines captured separately."""
+        return re.compile(r"(?P<open>^\s*---)(?P<frontmatter>.*?)(?P<close>---)", flags=re.DOTALL)
+
+    @cached_property
+    def code_block(self) -> re.Pattern:
+        """Fenced code blocks."""
+        return re.compile(r"```.*?```", flags=re.DOTALL)
+
+    @cached_property
+    def inline_code(self) -> re.Pattern:
+        """Inline code wrapped in single backticks."""
+        return re.compile(r"(?<!`{2})`[^`]+?` ?")
+
+    @cached_property
+    def inline_separator(self) -> re.Pattern:
+        """Double colon separating an inline metadata key from its value."""
+        return re.compile(r"(?<!:)::(?!:)")
+
+    @cached_property
+    def inline_metadata(self) -> re.Pattern:
+        """Inline metadata with optional bracket or parenthesis wrapping."""
+        # Keys and values never span a line break (re.W stops `.` at any line separator) which
+        # allows the pattern to run over an entire note in a single pass
+        return re.compile(
+            r"""
+            (?: # Conditional
+                (?= # If opening wrapper is a bracket or parenthesis
+                    (
                         (?<!\[)\[(?!\[) # Single bracket
+                        |               # Or
+                        (?<!\()\((?!\() # Single parenthesis
+                        )
                     )
-                        (?<!\[)(?P<open>\[)(?!\[)           # Open bracket
-                        (?P<key>[0-9\p{Letter}\w\s_/-;\*\~`]+?)  # Find key
-                        (?<!:)::(?!:)                       # Separator
-                        (?P<value>.*?)                      # Value
-                        (?<!\])(?P<close>\])(?!\])          # Close bracket
-                    | # Else if opening wrapper is a parenthesis
-                        (?<!\()(?P<open>\()(?!\()           # Open parens
-                        (?P<key>[0-9\p{Letter}\w\s_/-;\*\~`]+?)  # Find key
-                        (?<!:)::(?!:)                       # Separator
-                        (?P<value>.*?)                      # Value
-                        (?<!\))(?P<close>\))(?!\))          # Close parenthesis
-                )
-                | # Else grab entire line
-                (?P<key>[0-9\p{Letter}\w\s_/-;\*\~`]+?)          # Find key
-                (?<!:)::(?!:)                               # Separator
-                (?P<value>.*)                               # Value
-        )
+                    (?: # Conditional
+                        (?= # If opening wrapper is a bracket
+                            (?<!\[)\[(?!\[) # Single bracket
+                        )
+                            (?<!\[)(?P<open>\[)(?!\[)           # Open bracket
+                            (?P<key>[0-9\p{Letter}\w\t\p{Zs}_/-;\*\~`]+?)  # Find key
+                            (?<!:)::(?!:)                       # Separator
+                            (?P<value>.*?)                      # Value
+                            (?<!\])(?P<close>\])(?!\])          # Close bracket
+                        | # Else if opening wrapper is a parenthesis
+                            (?<!\()(?P<open>\()(?!\()           # Open parens
+                            (?P<key>[0-9\p{Letter}\w\t\p{Zs}_/-;\*\~`]+?)  # Find key
+                            (?<!:)::(?!:)                       # Separator
+                            (?P<value>.*?)                      # Value
+                            (?<!\))(?P<close>\))(?!\))          # Close parenthesis
+                    )
+                    | # Else grab entire line
+                    (?P<key>[0-9\p{Letter}\w\t\p{Zs}_/-;\*\~`]+?)          # Find key
+                    (?<!:)::(?!:)                               # Separator
+                    (?P<value>.*)                               # Value
+            )
 
-    """,
-        re.X | re.I,
-    )
-    top_with_header = re.compile(
-        r"""^\s*                                        # Start of note
-        (?P<top>                                        # Capture the top of the note
-            .*                                         # Anything above the first header
-            \#+[ ].*?[\r\n]                           # Full header, if it exists
-        )                                               # End capture group
         """,
-        flags=re.DOTALL | re.X,
-    )
-    validate_key_text = re.compile(r"[^-_\w\d\/\*\u263a-\U0001f999]")
-    validate_tag_text = re.compile(r"[ \|,;:\*\(\)\[\]\\\.\n#&]")
+            re.X | re.I | re.W,
+        )
+
+    @cached_property
+    def top_with_header(self) -> re.Pattern:
+        """Top of a note through the end of the first markdown header."""
+        return re.compile(
+            r"""^\s*                                        # Start of note
+            (?P<top>                                        # Capture the top of the note
+                .*                                         # Anything above the first header
+                \#+[ ].*?[\r\n]                           # Full header, if it exists
+            )                                               # End capture group
+            """,
+            flags=re.DOTALL | re.X,
+        )
+
+    @cached_property
+    def validate_key_text(self) -> re.Pattern:
+        """Characters which are not allowed in a metadata key."""
+        return re.compile(r"[^-_\w\d\/\*\u263a-\U0001f999]")
+
+    @cached_property
+    def validate_tag_text(self) -> re.Pattern:
+        """Characters which are not allowed in a tag."""
+        return re.compile(r"[ \|,;:\*\(\)\[\]\\\.\n#&]")
 
     def return_inline_metadata(self, line: str) -> list[tuple[str, str, Wrapping]] | None:
-        """Return a list of metadata matches for a single line.
+        """Return a list of metadata matches for a line or a multiline block of text.
 
         Args:
             line (str): The text to search.
@@ -98,12 +131,16 @@ class Parser:
         Returns:
             list[tuple[str, str, Wrapping]] | None: A list of tuples containing the key, value, and wrapping type.
         """
-        sep = r"(?<!:)::(?!:)"
-        if not re.search(sep, line):
+        # The substring check rules out most notes before running the regex
+        if "::" not in line or not self.inline_separator.search(line):
             return None
 
-        # Replace emoji with text
-        line = emoji.demojize(line, delimiters=(";", ";"))
+        # Matches never span a line break, so only lines containing a separator are searched
+        line = "\n".join(x for x in line.split("\n") if "::" in x)
+
+        # Replace emoji with text. Emoji are never ASCII, so ASCII text is left as is
+        if not line.isascii():
+            line = emoji.demojize(line, delimiters=(";", ";"))
 
         matches = []
         for match in self.inline_metadata.finditer(line):
@@ -115,10 +152,12 @@ class Parser:
                 case _:
                     wrapper = Wrapping.NONE
 
+            key = match.group("key")
+            value = match.group("value")
             matches.append(
                 (
-                    emoji.emojize(match.group("key"), delimiters=(";", ";")),
-                    emoji.emojize(match.group("value"), delimiters=(";", ";")),
+                    emoji.emojize(key, delimiters=(";", ";")) if ";" in key else key,
+                    emoji.emojize(value, delimiters=(";", ";")) if ";" in value else value,
                     wrapper,
                 )
             )
@@ -135,6 +174,11 @@ class Parser:
         Returns:
             str | None: The frontmatter block, or None if no frontmatter is found.
         """
+        # Frontmatter can only be preceded by whitespace. Checking this first avoids scanning the
+        # entire note for `---` when there is no frontmatter.
+        if not text.lstrip().startswith("---"):
+            return None
+
         if data_only:
             result = self.frontmatter_data.search(text)
         else:
@@ -147,26 +191,59 @@ class Parser:
     def return_tags(self, text: str) -> list[str]:
         """Return a list of tags.
 
+        Jumps between `#` characters with `str.find` instead of running a regex over the entire text. A tag is only returned when preceded by the start of the text, whitespace, two backslashes, or another tag.
+
         Args:
             text (str): The text to search.
 
         Returns:
             list[str]: A list of tags.
         """
-        return [
-            t.group("tag")
-            for t in self.tag.finditer(text)
-            if not re.match(r"^#[0-9]+$", t.group("tag"))
-        ]
+        tags = []
+        text_length = len(text)
+        previous_tag_end = 0
+
+        start = text.find("#")
+        while start != -1:
+            end = start + 1
+            while end < text_length and text[end] not in self.not_in_tags:
+                end += 1
 
-    def return_top_with_header(self, text: str) -> str:
+            if end == start + 1:  # A lone '#' is not a tag
+                start = text.find("#", end)
+                continue
+
+            is_tag = (
+                start == 0
+                or start == previous_tag_end
+                or text[start - 1] in self.whitespace
+                or text[start - 2 : start] == "\\\\"
+            )
+            if not is_tag and text[start - 1] not in self.not_in_tags:
+                # Tags directly following other tag text are valid. i.e. 'foo#bar#baz' returns '#baz'
+                preceding = start - 1
+                while preceding >= 0 and text[preceding] not in self.not_in_tags:
+                    preceding -= 1
+                is_tag = preceding >= 0 and text[preceding] == "#"
+
+            if is_tag:
+                previous_tag_end = end
+                tag = text[start:end]
+                if not (tag[1:].isascii() and tag[1:].isdigit()):  # Skip numeric tags. i.e. '#123'
+                    tags.append(tag)
+
+            start = text.find("#", end)
+
+        return tags
+
+    def return_top_with_header(self, text: str) -> str | None:
         """Returns the top content of a string until the end of the first markdown header found.
 
         Args:
             text (str): The text to search.
 
         Returns:
-            str: The top content of the string.
+            str | None: The top content of the string, or None if no header is found.
         """
         result = self.top_with_header.search(text)
         if result:
@@ -180,6 +257,9 @@ class Parser:
             text (str): The text to search.
             data_only (bool, optional): If True, only strip the frontmatter data and leave the '---' lines. Defaults to False
         """
+        if not text.lstrip().startswith("---"):
+            return text
+
         if data_only:
             return self.frontmatter_data.sub(r"\g<open>\n\g<close>", text)
 
@@ -187,8 +267,14 @@ class Parser:
 
     def strip_code_blocks(self, text: str) -> str:
         """Strip code blocks from a string."""
+        if "```" not in text:
+            return text
+
         return self.code_block.sub("", text)
 
     def strip_inline_code(self, text: str) -> str:
         """Strip inline code from a string."""
+        if "`" not in text:
+            return text
+
         return self.inline_code.sub("", text)
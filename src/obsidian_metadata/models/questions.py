@@ -6,6 +6,8 @@ Progress towards testing questionary can be found on this issue:
 https://github.com/tmbo/questionary/issues/35
 """
 import re
+import stat
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -27,10 +29,26 @@ questionary.prompts.path.DEFAULT_STYLE = questionary.Style([("qmark", "")])
 questionary.prompts.select.DEFAULT_STYLE = questionary.Style([("qmark", "")])
 questionary.prompts.text.DEFAULT_STYLE = questionary.Style([("qmark", "")])
 
+# Style shared by every question. Styles are immutable so a single instance is reused
+STYLE = questionary.Style(
+    [
+        ("qmark", "bold"),
+        ("question", "bold"),
+        ("separator", "fg:#808080"),
+        ("answer", "fg:#FF9D00 bold"),
+        ("instruction", "fg:#808080"),
+        ("highlighted", "bold underline"),
+        ("text", ""),
+        ("pointer", "bold"),
+    ]
+)
+
 
 class Questions:
     """Class for asking questions to the user and validating responses with questionary."""
 
+    style = STYLE
+
     @staticmethod
     def ask_for_vault_path() -> Path:  # pragma: no cover
         """Ask the user for the path to their vault.
@@ -55,10 +73,14 @@ class Questions:
         Returns:
             bool | str: True if the path is valid, otherwise a string with the error message.
         """
-        path_to_validate: Path = Path(path).expanduser().resolve()
-        if not path_to_validate.exists():
+        # Runs on every keystroke, so the path is checked with a single stat call and is not
+        # resolved. The accepted path is resolved by ask_for_vault_path.
+        path_to_validate: Path = Path(path).expanduser()
+        try:
+            mode = path_to_validate.stat().st_mode
+        except OSError:
             return f"Path does not exist: {path_to_validate}"
-        if not path_to_validate.is_dir():
+        if not stat.S_ISDIR(mode):
             return f"Path is not a directory: {path_to_validate}"
 
         return True
@@ -71,18 +93,6 @@ class Questions:
             vault (Vault, optional): The vault object. Defaults to None.
             key (str, optional): The key to use when validating a key, value pair. Defaults to None.
         """
-        self.style = questionary.Style(
-            [
-                ("qmark", "bold"),
-                ("question", "bold"),
-                ("separator", "fg:#808080"),
-                ("answer", "fg:#FF9D00 bold"),
-                ("instruction", "fg:#808080"),
-                ("highlighted", "bold underline"),
-                ("text", ""),
-                ("pointer", "bold"),
-            ]
-        )
         self.vault = vault
         self.key = key
 
@@ -92,7 +102,7 @@ class Questions:
         Returns:
             bool | str: True if the tag is valid, otherwise a string with the error message.
         """
-        if len(text) < 1:
+        if not text:
             return "Tag cannot be empty"
 
         if not self.vault.contains_metadata(meta_type=MetadataType.TAGS, key=None, value=text):
@@ -106,7 +116,7 @@ class Questions:
         Returns:
             bool | str: True if the key is valid, otherwise a string with the error message.
         """
-        if len(text) < 1:
+        if not text:
             return "Key cannot be empty"
 
         if not self.vault.contains_metadata(meta_type=MetadataType.META, key=text):
@@ -120,7 +130,7 @@ class Questions:
         Returns:
             bool | str: True if the key is valid, otherwise a string with the error message.
         """
-        if len(text) < 1:
+        if not text:
             return "Key cannot be empty"
 
         try:
@@ -145,7 +155,7 @@ class Questions:
         if P.validate_key_text.search(text) is not None:
             return "Key cannot contain spaces or special characters"
 
-        if len(text) == 0:
+        if not text:
             return "New key cannot be empty"
 
         return True
@@ -162,7 +172,7 @@ class Questions:
         if P.validate_tag_text.search(text) is not None:
             return "Tag cannot contain spaces or special characters"
 
-        if len(text) == 0:
+        if not text:
             return "New tag cannot be empty"
 
         return True
@@ -176,7 +186,7 @@ class Questions:
         Returns:
             bool | str: True if the value is valid, otherwise a string with the error message.
         """
-        if len(text) < 1:
+        if not text:
             return "Value cannot be empty"
 
         if self.key is not None and self.vault.contains_metadata(
@@ -217,6 +227,11 @@ class Questions:
 
         return True
 
+    @cached_property
+    def _vault_paths(self) -> list[str]:
+        """Paths in the vault. Listed once as the regex validator runs on every keystroke."""
+        return [str(x) for x in self.vault.vault_path.glob("**/*")]
+
     def _validate_valid_vault_regex(self, text: str) -> bool | str:
         """Validate a valid regex.
 
@@ -224,14 +239,13 @@ class Questions:
             bool | str: True if the regex is valid, otherwise a string with the error message.
         """
         try:
-            re.compile(text)
+            pattern = re.compile(text)
         except re.error as error:
             return f"Invalid regex: {error}"
 
         if self.vault is not None:
-            for subdir in list(self.vault.vault_path.glob("**/*")):
-                if re.search(text, str(subdir)):
-                    return True
+            if any(pattern.search(path) for path in self._vault_paths):
+                return True
             return "Regex does not match paths in the vault"
 
         return True
@@ -245,7 +259,7 @@ class Questions:
         Returns:
             bool | str: True if the value is valid, otherwise a string with the error message.
         """
-        if len(text) == 0:
+        if not text:
             return True
 
         if self.key is not None and not self.vault.contains_metadata(
@@ -264,7 +278,7 @@ class Questions:
         Returns:
             bool | str: True if the value is valid, otherwise a string with the error message.
         """
-        if len(text) < 1:
+        if not text:
             return "Regex cannot be empty"
 
         try:
@@ -4,6 +4,7 @@ import csv
 import json
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -70,9 +71,13 @@ class Vault:
             "Processing notes...  [dim](Can take a while for a large vault)[/]",
             spinner="bouncingBall",
         ):
-            self.all_notes: list[Note] = [
-                Note(note_path=p, dry_run=self.dry_run) for p in self.all_note_paths
-            ]
+            # Reading notes is bound by disk latency, so files are read concurrently
+            with ThreadPoolExecutor() as executor:
+                self.all_notes: list[Note] = list(
+                    executor.map(
+                        lambda p: Note(note_path=p, dry_run=self.dry_run), self.all_note_paths
+                    )
+                )
             self.notes_in_scope = self._filter_notes()
 
         self._rebuild_vault_metadata()
@@ -100,10 +105,11 @@ class Vault:
 
         for _filter in self.filters:
             if _filter.path_filter is not None:
+                path_pattern = re.compile(_filter.path_filter)
                 notes_list = [
                     n
                     for n in notes_list
-                    if re.search(_filter.path_filter, str(n.note_path.relative_to(self.vault_path)))
+                    if path_pattern.search(str(n.note_path.relative_to(self.vault_path)))
                 ]
 
             if _filter.tag_filter is not None:
@@ -297,12 +303,12 @@ class Vault:
                     )
             return
 
-        for _note in self.notes_in_scope:
-            if _note.has_changes():
-                log.trace(f"writing to {_note.note_path}")
-                _note.commit()
+        changed_notes = [x for x in self.notes_in_scope if x.has_changes()]
+        # Consume the results so that errors raised while writing are not swallowed
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(lambda x: x.commit(), changed_notes))
 
-    def contains_metadata(
+    def contains_metadata(  # noqa: PLR0911
         self, meta_type: MetadataType, key: str, value: str | None = None, is_regex: bool = False
     ) -> bool:
         """Check if the vault contains metadata.
@@ -324,8 +330,10 @@ class Vault:
 
         if meta_type == MetadataType.TAGS and value is not None:
             if not is_regex:
-                value = f"^{re.escape(value)}$"
-            return any(re.search(value, item) for item in self.tags)
+                return value in self.tags
+
+            value_pattern = re.compile(value)
+            return any(value_pattern.search(item) for item in self.tags)
 
         if meta_type == MetadataType.META:
             return self.contains_metadata(
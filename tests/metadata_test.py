@@ -1,6 +1,8 @@
 # type: ignore
 """Test the InlineField class."""
 
+import copy
+
 import pytest
 
 from obsidian_metadata.models.enums import MetadataType, Wrapping
@@ -207,3 +209,36 @@ def test_inline_field_init_4():
     obj.key_close = "**"
     assert obj.key_open == "**"
     assert obj.key_close == "**"
+
+
+def test_inline_field_init_7():
+    """Test interning of keys.
+
+    GIVEN creating two objects
+    WHEN the keys are equal but distinct string objects
+    THEN the key, clean_key and normalized_key attributes share the same string objects
+    """
+    obj1 = InlineField(meta_type=MetadataType.INLINE, key="".join(["**Key", " one**"]), value="1")
+    obj2 = InlineField(meta_type=MetadataType.INLINE, key="".join(["**Key one", "**"]), value="2")
+    assert obj1.key is obj2.key
+    assert obj1.clean_key is obj2.clean_key
+    assert obj1.normalized_key is obj2.normalized_key
+
+
+def test_inline_field_copy_1():
+    """Test copying an InlineField.
+
+    GIVEN an InlineField object
+    WHEN the object is copied and the copy is changed
+    THEN the original object is not changed
+    """
+    obj = InlineField(meta_type=MetadataType.INLINE, key="**key**", value="value")
+    new = copy.copy(obj)
+    assert new == obj
+    assert new is not obj
+    assert new.key_open == "**"
+
+    new.value = "new value"
+    new.is_changed = True
+    assert obj.value == "value"
+    assert obj.is_changed is False
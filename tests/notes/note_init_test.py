@@ -47,7 +47,7 @@ def test_create_note_2(tmp_path) -> None:
     """Test creating a note object.
 
     GIVEN a text file with invalid frontmatter
-    WHEN the note is initialized
+    WHEN the note's metadata is parsed
     THEN a typer exit is raised
     """
     note_path = Path(tmp_path) / "broken_frontmatter.md"
@@ -60,14 +60,14 @@ invalid = = "content"
 """
     )
     with pytest.raises(typer.Exit):
-        Note(note_path=note_path)
+        Note(note_path=note_path).metadata  # noqa: B018
 
 
 def test_create_note_3(tmp_path) -> None:
     """Test creating a note object.
 
     GIVEN a text file with invalid frontmatter
-    WHEN the note is initialized
+    WHEN the note's metadata is parsed
     THEN a typer exit is raised
     """
     note_path = Path(tmp_path) / "broken_frontmatter.md"
@@ -83,7 +83,7 @@ nested1:
 """
     )
     with pytest.raises(typer.Exit):
-        Note(note_path=note_path)
+        Note(note_path=note_path).metadata  # noqa: B018
 
 
 def test_create_note_6(tmp_path):
@@ -102,6 +102,26 @@ def test_create_note_6(tmp_path):
     assert note.metadata == []
 
 
+def test_create_note_7(tmp_path):
+    """Test creating a note object.
+
+    GIVEN a text file with invalid frontmatter
+    WHEN the note is initialized and its metadata is never accessed
+    THEN the note is created without parsing its metadata
+    """
+    note_path = Path(tmp_path) / "broken_frontmatter.md"
+    note_path.write_text(
+        """---
+tags:
+invalid = = "content"
+---
+"""
+    )
+    note = Note(note_path=note_path)
+    assert not note.has_changes()
+    assert "metadata" not in note.__dict__
+
+
 def test__grab_metadata_1(tmp_path):
     """Test the _grab_metadata method.
 
@@ -233,4 +253,32 @@ invalid = = "content"
 """
     )
     with pytest.raises(typer.Exit):
-        Note(note_path=note_path)
+        Note(note_path=note_path).metadata  # noqa: B018
+
+
+def test__grab_metadata_6(tmp_path):
+    """Test the _grab_metadata method.
+
+    GIVEN a text file with duplicate metadata
+    WHEN the note is initialized
+    THEN duplicates are removed and metadata is returned in the order it was found
+    """
+    note_path = Path(tmp_path) / "test_file.md"
+    note_path.touch()
+    note_path.write_text(
+        """\
+---
+key1: value1
+---
+key2::value2
+#tag2 #tag1
+key2::value2
+#tag2"""
+    )
+    note = Note(note_path=note_path)
+    assert note.metadata == [
+        InlineField(meta_type=MetadataType.FRONTMATTER, key="key1", value="value1"),
+        InlineField(meta_type=MetadataType.INLINE, key="key2", value="value2"),
+        InlineField(meta_type=MetadataType.TAGS, key=None, value="tag2"),
+        InlineField(meta_type=MetadataType.TAGS, key=None, value="tag1"),
+    ]
@@ -10,6 +10,7 @@ from tests.helpers import Regex
 
 from obsidian_metadata._utils.console import console
 from obsidian_metadata.models.enums import InsertLocation, MetadataType
+from obsidian_metadata.models.metadata import InlineField
 from obsidian_metadata.models.notes import Note
 
 
@@ -20,6 +21,7 @@ from obsidian_metadata.models.notes import Note
         ("foo\nkey:: value\nbar", "foo\nbar"),
         ("foo\n     key:: value    \nbar\nbaz", "foo\nbar\nbaz"),
         ("> blockquote\n> key:: value\n > blockquote2", "> blockquote\n> blockquote2"),
+        ("> blockquote\n> key:: value", "> blockquote\n"),
         ("foo (**key**:: value) bar", "foo bar"),
         ("foo [**key**:: value] bar", "foo bar"),
     ],
@@ -40,6 +42,38 @@ def test__delete_inline_metadata_1(tmp_path, content, new_content):
     assert note.file_content == new_content
 
 
+def test__delete_inline_metadata_batch_1(tmp_path):
+    """Test _delete_inline_metadata_batch() method.
+
+    GIVEN a note object with multiple inline metadata fields
+    WHEN deleting several fields at once
+    THEN all fields are removed from the content and no failures are returned
+    """
+    note_path = Path(tmp_path) / "note.md"
+    note_path.write_text(
+        "foo\nkey1:: value1\nbar (key2:: value2) baz [key3:: value3]\nkey4:: value4"
+    )
+    note = Note(note_path=note_path)
+    to_delete = [x for x in note.metadata if x.clean_key in {"key1", "key2", "key3"}]
+    assert note._delete_inline_metadata_batch(to_delete) == []
+    assert note.file_content == "foo\nbar baz\nkey4:: value4"
+
+
+def test__delete_inline_metadata_batch_2(tmp_path):
+    """Test _delete_inline_metadata_batch() method.
+
+    GIVEN a note object
+    WHEN deleting a field which is not in the note content
+    THEN the field is returned as a failure
+    """
+    note_path = Path(tmp_path) / "note.md"
+    note_path.write_text("key1:: value1")
+    note = Note(note_path=note_path)
+    missing = InlineField(meta_type=MetadataType.INLINE, key="key2", value="value2")
+    assert note._delete_inline_metadata_batch([note.metadata[0], missing]) == [missing]
+    assert note.file_content == ""
+
+
 @pytest.mark.parametrize(
     ("content", "new_key", "new_content"),
     [
@@ -96,6 +130,24 @@ def test__edit_inline_metadata_2(tmp_path, content, new_key, new_value, new_cont
     assert new_field in note.metadata
 
 
+def test_commit_4(sample_note, tmp_path) -> None:
+    """Test commit() method.
+
+    GIVEN a note object with commit() called
+    WHEN the note has no changes
+    THEN the note is not rewritten unless a new path is given
+    """
+    note = Note(note_path=sample_note)
+    sample_note.write_text("changed on disk")
+
+    note.commit()
+    assert sample_note.read_text() == "changed on disk"
+
+    new_path = Path(tmp_path / "new_note.md")
+    note.commit(new_path)
+    assert new_path.read_text() == note.file_content
+
+
 @pytest.mark.parametrize(
     ("meta_type", "key", "value", "is_regex", "expected"),
     [
@@ -428,6 +480,24 @@ def test_commit_3(tmp_path) -> None:
     assert "Heading 2" in dest_file.read_text(encoding="cp1250")
 
 
+def test_commit_5(tmp_path) -> None:
+    """Test that commit() method writes non-ASCII content to ASCII notes.
+
+    GIVEN a file containing only ASCII characters
+    WHEN non-ASCII content is added and the note is committed
+    THEN the file is written as UTF-8
+    """
+    note_path = Path(tmp_path / "ascii.md")
+    note_path.write_bytes(b"# Heading\n")
+
+    note = Note(note_path=note_path)
+    assert note.encoding == "utf_8"
+
+    note.sub(pattern="Heading", replacement="Überschrift")
+    note.commit()
+    assert note_path.read_bytes() == "# Überschrift\n".encode()
+
+
 @pytest.mark.parametrize(
     ("meta_type", "key", "value", "is_regex", "expected"),
     [
@@ -621,6 +691,23 @@ def test_delete_metadata_3(sample_note, meta_type, key, value, is_regex):
     )
 
 
+def test_delete_metadata_4(tmp_path) -> None:
+    """Test delete_metadata() method.
+
+    GIVEN a note with tags
+    WHEN deleting tags
+    THEN the tags are removed and the characters following them are kept
+    """
+    note_path = Path(tmp_path) / "note.md"
+    note_path.write_text("foo #tag1 bar #tag1/sub, #tag2\n#tag1#tag2 \n")
+    note = Note(note_path=note_path)
+
+    assert note.delete_metadata(MetadataType.TAGS, value="tag1") is True
+    assert note.file_content == "foo  bar #tag1/sub, #tag2\n#tag2 \n"
+    assert note.delete_all_metadata() is True
+    assert note.file_content == "foo  bar , \n \n"
+
+
 def test_delete_all_metadata_1(sample_note) -> None:
     """Test delete_all_metadata() method.
 
@@ -653,6 +740,11 @@ def test_has_changes(sample_note) -> None:
     note.delete_all_metadata()
     assert note.has_changes() is True
 
+    note = Note(note_path=sample_note)
+    note.file_content = "".join(list(note.file_content))
+    assert note.file_content is not note.original_file_content
+    assert note.has_changes() is False
+
 
 def test_print_diff(sample_note, capsys) -> None:
     """Test print_diff() method.
@@ -674,6 +766,14 @@ def test_print_diff(sample_note, capsys) -> None:
     assert "- The quick brown fox" in captured.out
     assert "+ The quick brown hedgehog" in captured.out
 
+    note.print_diff()
+    assert capsys.readouterr().out == captured.out
+
+    note.delete_all_metadata()
+    note.print_diff()
+    captured = capsys.readouterr()
+    assert "- ---" in captured.out
+
 
 def test_print_note(sample_note, capsys) -> None:
     """Test print_note() method.
@@ -739,6 +839,24 @@ def test_rename_metadata_1(sample_note, key, value1, value2, content, result) ->
         assert note.has_changes() is False
 
 
+def test_rename_metadata_2(tmp_path) -> None:
+    """Test rename_metadata() method.
+
+    GIVEN a note with several inline fields sharing a key
+    WHEN the value of the fields is renamed to a value containing backslashes
+    THEN every field is renamed and the new value is written verbatim
+    """
+    note_path = Path(tmp_path) / "note.md"
+    note_path.write_text("key:: value\n[key:: value]\ntext (key:: value) text\n")
+    note = Note(note_path=note_path)
+
+    assert note.rename_metadata(key="key", value_1="value", value_2="C:\\new\\1") is True
+    assert note.file_content == (
+        "key:: C:\\new\\1\n[key:: C:\\new\\1]\ntext (key:: C:\\new\\1) text\n"
+    )
+    assert all(x.normalized_value == "C:\\new\\1" for x in note.metadata)
+
+
 def test_rename_tag_1(sample_note) -> None:
     """Test rename_tag() method.".
 
@@ -771,6 +889,23 @@ def test_rename_tag_2(sample_note) -> None:
     assert note.rename_tag(old_tag="not a tag", new_tag="#tag3") is False
 
 
+def test_rename_tag_3(tmp_path) -> None:
+    """Test rename_tag() method.
+
+    GIVEN a note with tags which begin with the tag to rename
+    WHEN rename_tag() is called
+    THEN only the complete tag is renamed, including at the end of the note
+    """
+    note_path = Path(tmp_path) / "note.md"
+    note_path.write_text("#foo #food #foo/bar\n#foo")
+    note = Note(note_path=note_path)
+
+    assert note.rename_tag(old_tag="foo", new_tag="baz") is True
+    assert note.file_content == "#baz #food #foo/bar\n#baz"
+    assert note.delete_metadata(MetadataType.TAGS, value="baz") is True
+    assert note.file_content == " #food #foo/bar\n"
+
+
 def test_sub_1(sample_note) -> None:
     """Test the sub() method.
 
@@ -809,6 +944,40 @@ def test_sub_3(sample_note) -> None:
     assert note.file_content == note2.file_content
 
 
+def test_sub_4(tmp_path) -> None:
+    """Test the sub() method.
+
+    GIVEN a note object
+    WHEN sub() is called with a pattern that matches more than eight times or is anchored to lines
+    THEN every match is replaced and the anchors match at line boundaries
+    """
+    note_path = Path(tmp_path / "note.md")
+    note_path.write_text("\n".join(f"line {i} x" for i in range(12)))
+    note = Note(note_path=note_path)
+
+    assert note.sub("x", "y") is True
+    assert note.file_content.count("y") == 12
+    assert note.sub(r"^line", "row", is_regex=True) is True
+    assert note.sub(r"y$", "z", is_regex=True) is True
+    assert note.file_content.splitlines() == [f"row {i} z" for i in range(12)]
+
+
+def test_sub_5(tmp_path) -> None:
+    """Test the sub() method.
+
+    GIVEN a note object
+    WHEN sub() is called with plain text containing backslashes and group references
+    THEN the text is replaced literally
+    """
+    note_path = Path(tmp_path / "note.md")
+    note_path.write_text("path: C:\\notes (1)\n")
+    note = Note(note_path=note_path)
+
+    assert note.sub("C:\\notes (1)", r"D:\new\1 \g<0>") is True
+    assert note.file_content == "path: D:\\new\\1 \\g<0>\n"
+    assert note.sub("C:\\notes", "") is False
+
+
 @pytest.mark.parametrize(
     ("begin", "end", "key", "value", "location"),
     [
@@ -945,6 +1114,29 @@ def test_transpose_metadata_3(sample_note):
     )
 
 
+@pytest.mark.parametrize(
+    ("location", "result"),
+    [
+        (InsertLocation.TOP, "a:: 1\nb:: 2\nc::\n# Header\ntext\n"),
+        (InsertLocation.AFTER_TITLE, "# Header\na:: 1\nb:: 2\nc::\ntext\n"),
+        (InsertLocation.BOTTOM, "# Header\ntext\n\na:: 1\nb:: 2\nc::"),
+    ],
+)
+def test_transpose_metadata_4(tmp_path, location, result):
+    """Test transpose_metadata() method.
+
+    GIVEN a note with several inline fields
+    WHEN all inline metadata is moved to a new location
+    THEN the fields are removed and written to the new location in sorted order
+    """
+    note_path = Path(tmp_path) / "note.md"
+    note_path.write_text("# Header\nc::\ntext\nb:: 2\na:: 1\n")
+    note = Note(note_path=note_path)
+
+    assert note.transpose_metadata(MetadataType.INLINE, MetadataType.INLINE, location=location)
+    assert note.file_content == result
+
+
 def test_write_frontmatter_1(tmp_path) -> None:
     """Test writing frontmatter.
 
@@ -1028,7 +1220,8 @@ no frontmatter
         added_key="french",
         added_value="Voix ambiguë d'un cœur qui, au zéphyr, préfère les jattes de kiwis.",
     )
-    assert note.write_frontmatter() is True
+    # add_metadata() already wrote the frontmatter so there is nothing left to write
+    assert note.write_frontmatter() is False
     assert note.file_content == new_note
 
 
@@ -1065,10 +1258,45 @@ no frontmatter
 
     note = Note(note_path=note_path)
     note.add_metadata(meta_type=MetadataType.FRONTMATTER, added_key="key2", added_value="value2")
-    assert note.write_frontmatter() is True
+    # add_metadata() already wrote the frontmatter so there is nothing left to write
+    assert note.write_frontmatter() is False
     assert note.file_content == new_note
 
 
+def test_write_frontmatter_5(tmp_path) -> None:
+    """Test writing frontmatter.
+
+    GIVEN a note with frontmatter
+    WHEN the new frontmatter contains backslashes
+    THEN the frontmatter is written verbatim
+    """
+    note_path = Path(tmp_path) / "note.md"
+    note_path.write_text("---\nkey: value\n---\n# Header1\n")
+
+    note = Note(note_path=note_path)
+    note.add_metadata(
+        meta_type=MetadataType.FRONTMATTER, added_key="path", added_value="C:\\new\\1"
+    )
+    # add_metadata() already wrote the frontmatter so there is nothing left to write
+    assert note.write_frontmatter() is False
+    assert note.file_content == "---\nkey: value\npath: C:\\new\\1\n---\n# Header1\n"
+
+
+def test_write_frontmatter_6(tmp_path) -> None:
+    """Test writing frontmatter.
+
+    GIVEN a note with frontmatter
+    WHEN the frontmatter in the note already matches the note's metadata
+    THEN no changes are made
+    """
+    note_path = Path(tmp_path) / "note.md"
+    note_path.write_text("---\nkey: value\ntags:\n  - one\n  - two\n---\n# Header1\n")
+
+    note = Note(note_path=note_path)
+    assert note.write_frontmatter() is False
+    assert note.has_changes() is False
+
+
 @pytest.mark.parametrize(
     ("location"), [InsertLocation.TOP, InsertLocation.BOTTOM, InsertLocation.AFTER_TITLE]
 )
@@ -1134,3 +1362,25 @@ def test_write_string_3(tmp_path, location, result) -> None:
 
     note.write_string("baz", location=location)
     assert note.file_content.strip() == result
+
+
+@pytest.mark.parametrize(
+    ("location", "result"),
+    [
+        (InsertLocation.TOP, "---\nkey: value\n---\nbaz:: C:\\new\\1\n# Header1\nfoo bar"),
+        (InsertLocation.AFTER_TITLE, "---\nkey: value\n---\n# Header1\nbaz:: C:\\new\\1\nfoo bar"),
+    ],
+)
+def test_write_string_4(tmp_path, location, result) -> None:
+    """Test write_string() method.
+
+    GIVEN a note with frontmatter
+    WHEN a string containing backslashes is written to the note
+    THEN the string is written verbatim to the correct location
+    """
+    note_path = Path(tmp_path) / "note.md"
+    note_path.write_text("---\nkey: value\n---\n# Header1\nfoo bar")
+    note = Note(note_path=note_path)
+
+    assert note.write_string("baz:: C:\\new\\1", location=location) is True
+    assert note.file_content.strip() == result
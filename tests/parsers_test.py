@@ -115,6 +115,19 @@ key: value
     assert P.return_frontmatter(content, data_only=True) is None
 
 
+def test_return_frontmatter_5():
+    """Test the return_frontmatter method.
+
+    GIVEN a string with frontmatter preceded by whitespace
+    WHEN the return_frontmatter method is called
+    THEN the frontmatter is returned
+    """
+    content = " \n\t\n---\nkey: value\n---\n# Hello World\n"
+    assert P.return_frontmatter(content) == "---\nkey: value\n---"
+    assert P.return_frontmatter(content, data_only=True) == "key: value"
+    assert P.return_frontmatter("---") is None
+
+
 def test_return_inline_metadata_1():
     """Test the return_inline_metadata method.
 
@@ -188,6 +201,22 @@ def test_return_inline_metadata_3(string, returned):
     assert P.return_inline_metadata(string) == returned
 
 
+def test_return_inline_metadata_4():
+    """Test the return_inline_metadata method.
+
+    GIVEN a multiline string with inline metadata on several lines
+    WHEN the return_inline_metadata method is called
+    THEN keys and values do not extend past the end of their line
+    """
+    string = "some text\nk1:: v1\r\n  spaced key:: v2\n[k3:: v3] (k4:: v4)\nfoo bar"
+    assert P.return_inline_metadata(string) == [
+        ("k1", " v1", Wrapping.NONE),
+        ("  spaced key", " v2", Wrapping.NONE),
+        ("k3", " v3", Wrapping.BRACKETS),
+        ("k4", " v4", Wrapping.PARENS),
+    ]
+
+
 @pytest.mark.parametrize(
     ("string", "returned"),
     [
@@ -202,6 +231,9 @@ def test_return_inline_metadata_3(string, returned):
         (r"\\#foo", ["#foo"]),
         ("#f#oo", ["#f", "#oo"]),
         ("#foo#bar#baz", ["#foo", "#bar", "#baz"]),
+        ("aa#foo#bar", ["#bar"]),
+        ("#123#foo", ["#foo"]),
+        ("foo\n#bar\tbaz #qux", ["#bar", "#qux"]),
     ],
 )
 def test_return_tags_1(string, returned):